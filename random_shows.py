@@ -97,10 +97,15 @@ def generate_random_shows(
         names = list(rng.sample(band_names, len(band_names)))
         names += list(rng.choices(band_names, k=count - len(band_names)))
 
+    # Inline ``uniform`` as ``a + (b - a) * random()`` (exactly what it computes)
+    # to save a Python-level call per draw while keeping seeded output stable.
+    draw = rng.random
+    start_span = end_hour - min_duration - start_hour
     shows: List[Show] = []
+    append = shows.append
     for name in names:
-        start = rng.uniform(start_hour, end_hour - min_duration)
-        duration = rng.uniform(min_duration, min(max_duration, end_hour - start))
-        end = start + duration
-        shows.append((name, round(start, 2), round(end, 2)))
+        start = start_hour + start_span * draw()
+        max_length = min(max_duration, end_hour - start)
+        duration = min_duration + (max_length - min_duration) * draw()
+        append((name, round(start, 2), round(start + duration, 2)))
     return shows
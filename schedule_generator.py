@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import argparse
 import json
-import importlib.util
 import random
-from heapq import heappush, heappop
+import runpy
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence, Tuple
 
@@ -74,15 +75,68 @@ def _random_stage_name() -> str:
     return f"{random.choice(stage_prefixes)} {random.choice(stage_suffixes)}"
 
 
-STAGE_NAMES = [random.choice(main_stages)] + [
-    _random_stage_name() for _ in range(19)
-]
+def _generate_default_stage_names() -> List[str]:
+    return [random.choice(main_stages)] + [_random_stage_name() for _ in range(19)]
+
+
+@lru_cache(maxsize=None)
+def get_stage_names() -> List[str]:
+    """Return the default pun stage names, generated on first use."""
+    return _generate_default_stage_names()
+
+
+@lru_cache(maxsize=None)
+def _default_stage_labels() -> Dict[int, str]:
+    return dict(enumerate(get_stage_names(), 1))
 
 
 Show = Tuple[str, float, float]
 Schedule = Dict[int, List[Show]]
 
 
+def _assign_stages(
+    starts: Sequence[float], ends: Sequence[float], start_order: Sequence[int]
+) -> Tuple[List[int], int]:
+    """Assign a stage number to each show.
+
+    ``start_order`` lists the show indices sorted by start time.  Every show
+    must end after it starts, so a show is never released before it has been
+    assigned a stage and the release loop always stops at the current show's
+    own end.  Only plain lists and integers are touched inside the sweep so
+    the loop body stays free of dict lookups and global name resolution.
+
+    Returns:
+        The stage number of each show, indexed by show, and the number of
+        stages opened.  Stages are only opened when none is free, so the count
+        equals the maximum number of overlapping shows and no separate overlap
+        pass is needed to size per-stage storage.
+    """
+    end_order = sorted(range(len(ends)), key=ends.__getitem__)
+    show_stage = [0] * len(starts)
+    # Any free stage will do to keep the stage count minimal, so freed stages
+    # are kept on a plain LIFO stack instead of a heap.
+    available: List[int] = []
+    release, acquire = available.append, available.pop
+    next_stage = 1
+    released = 0
+
+    for index in start_order:
+        start = starts[index]
+        # Free the stages of shows ending at or before this start; ends come
+        # before starts when times are equal.
+        while ends[end_order[released]] <= start:
+            release(show_stage[end_order[released]])
+            released += 1
+        if available:
+            stage = acquire()
+        else:
+            stage = next_stage
+            next_stage += 1
+        show_stage[index] = stage
+
+    return show_stage, next_stage - 1
+
+
 def generate_schedule(shows: Sequence[Show]) -> Schedule:
     """Generate a stage schedule for the given shows.
 
@@ -92,69 +146,50 @@ def generate_schedule(shows: Sequence[Show]) -> Schedule:
     Returns:
         Mapping of stage numbers to the list of shows assigned to that stage in
         chronological order.
-    """
-    events: List[Tuple[float, int, int]] = []
-    for index, (_, start, end) in enumerate(shows):
-        events.append((start, 1, index))  # 1 denotes start
-        events.append((end, 0, index))    # 0 denotes end; ensures end before start when times equal
 
-    events.sort()
-
-    available: List[int] = []
-    next_stage = 1
-    schedule: Schedule = {}
-    show_stage: Dict[int, int] = {}
+    Raises:
+        ValueError: If a show does not end after it starts.
+    """
+    for name, start, end in shows:
+        if not start < end:
+            raise ValueError(f"Show {name!r} must end after it starts")
 
-    for _, event_type, index in events:
-        if event_type == 1:  # start
-            if available:
-                stage = heappop(available)
-            else:
-                stage = next_stage
-                next_stage += 1
-            show_stage[index] = stage
-            schedule.setdefault(stage, []).append(shows[index])
-        else:  # end
-            stage = show_stage[index]
-            heappush(available, stage)
+    # Keep start and end times in parallel lists and sort index permutations
+    # by a single float key rather than sorting boxed (time, type, index)
+    # event tuples.
+    starts = [start for _, start, _ in shows]
+    ends = [end for _, _, end in shows]
+    start_order = sorted(range(len(shows)), key=starts.__getitem__)
+    show_stage, stage_count = _assign_stages(starts, ends, start_order)
 
-    return schedule
+    buckets: List[List[Show]] = [[] for _ in range(stage_count)]
+    for index in start_order:
+        buckets[show_stage[index] - 1].append(shows[index])
+    return dict(enumerate(buckets, 1))
 
 
 def load_shows(path: str) -> List[Show]:
     """Load shows from a Python module or JSON file."""
     file_path = Path(path)
     if file_path.suffix == ".py":
-        spec = importlib.util.spec_from_file_location("shows_module", file_path)
-        if not spec or not spec.loader:
-            raise ImportError(f"Cannot load module from {path}")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        shows = getattr(module, "shows", None)
+        shows = runpy.run_path(str(file_path)).get("shows")
         if shows is None:
             raise AttributeError(f"Module {path} does not define 'shows'")
         return list(shows)
     else:
-        with file_path.open() as f:
-            return [tuple(show) for show in json.load(f)]
+        return list(map(tuple, json.loads(file_path.read_bytes())))
 
 
 def load_stage_names(path: str) -> List[str]:
     """Load stage names from a Python module or JSON file."""
     file_path = Path(path)
     if file_path.suffix == ".py":
-        spec = importlib.util.spec_from_file_location("stage_names_module", file_path)
-        if not spec or not spec.loader:
-            raise ImportError(f"Cannot load module from {path}")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        names = getattr(module, "STAGE_NAMES", None)
+        names = runpy.run_path(str(file_path)).get("STAGE_NAMES")
         if names is None:
             raise AttributeError(f"Module {path} does not define 'STAGE_NAMES'")
         return list(names)
     else:
-        with file_path.open() as f:
-            return list(json.load(f))
+        return list(json.loads(file_path.read_bytes()))
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
@@ -179,33 +214,37 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     return args
 
 
-def print_schedule(schedule: Schedule) -> None:
-    """Pretty-print the schedule to the terminal."""
+def print_schedule(
+    schedule: Schedule, stage_names: Sequence[str] | None = None
+) -> None:
+    """Pretty-print the schedule to the terminal.
+
+    Stages are labelled with ``stage_names`` when given, otherwise with the
+    default names from :func:`get_stage_names`.
+    """
+    if stage_names:
+        labels = dict(enumerate(stage_names, 1))
+    else:
+        labels = _default_stage_labels()
+    lines: List[str] = []
+    append = lines.append
     for stage in sorted(schedule):
-        if stage - 1 < len(STAGE_NAMES):
-            stage_name = STAGE_NAMES[stage - 1]
-        else:
-            stage_name = f"Stage {stage}"
-        print(f"{stage_name}:")
-        for name, start, end in schedule[stage]:
-            print(f"  {name}: {start} - {end}")
+        append(f"{labels.get(stage) or f'Stage {stage}'}:")
+        lines.extend(
+            f"  {name}: {start} - {end}" for name, start, end in schedule[stage]
+        )
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: Iterable[str] | None = None) -> None:
-    global STAGE_NAMES
     args = parse_args(argv)
-    if args.stage_names:
-        STAGE_NAMES = args.stage_names
     shows = load_shows(args.input)
     schedule = generate_schedule(shows)
-    print_schedule(schedule)
+    print_schedule(schedule, args.stage_names)
     if args.output:
-        serialisable = {
-            stage: [list(show) for show in shows]
-            for stage, shows in schedule.items()
-        }
-        with open(args.output, "w") as f:
-            json.dump(serialisable, f, indent=2)
+        # json encodes the (name, start, end) tuples as arrays directly.
+        Path(args.output).write_text(json.dumps(schedule, indent=2))
 
 
 if __name__ == "__main__":
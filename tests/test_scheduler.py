@@ -3,6 +3,8 @@
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from schedule_generator import generate_schedule
@@ -58,3 +60,22 @@ def test_print_schedule_uses_stage_names(tmp_path, capsys):
     out = capsys.readouterr().out.splitlines()
     assert out[0] == "Alpha Arena:"
     assert out[3] == "Beta Base:"
+
+
+def test_print_schedule_falls_back_to_numbered_stages(capsys):
+    from schedule_generator import print_schedule
+
+    print_schedule({1: [("a", 0, 1)], 2: [("b", 0, 1)]}, ["Only Stage"])
+
+    out = capsys.readouterr().out.splitlines()
+    assert out == ["Only Stage:", "  a: 0 - 1", "Stage 2:", "  b: 0 - 1"]
+
+
+def test_rejects_zero_length_shows():
+    shows = [
+        ("a", 0, 1),
+        ("b", 1, 1),
+        ("c", 2, 3),
+    ]
+    with pytest.raises(ValueError, match="'b'"):
+        generate_schedule(shows)